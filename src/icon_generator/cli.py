@@ -1,6 +1,7 @@
 """Command-line interface for the iOS App Icon Generator."""
 
 import click
+import PIL
 from pathlib import Path
 from .config import Config
 from .generator import IconGenerator
@@ -59,6 +60,12 @@ def cli():
     is_flag=True,
     help='Skip background removal'
 )
+@click.option(
+    '--rembg-model',
+    type=click.Choice(['u2netp', 'u2net', 'isnet-general-use', 'silueta']),
+    default='u2netp',
+    help='Background removal model (u2netp is fastest, u2net/isnet most accurate)'
+)
 @click.option(
     '--output-dir',
     type=click.Path(),
@@ -83,6 +90,16 @@ def cli():
     default=None,
     help='Guidance scale (uses model default if not set)'
 )
+@click.option(
+    '--fast-png',
+    is_flag=True,
+    help='Fastest PNG compression (larger files, for quick iterations)'
+)
+@click.option(
+    '--optimize-png',
+    is_flag=True,
+    help='Recompress output PNGs with oxipng (smallest files, requires oxipng)'
+)
 def generate(
     subject: str,
     style: str,
@@ -92,10 +109,13 @@ def generate(
     no_process: bool,
     no_mask: bool,
     no_remove_bg: bool,
+    rembg_model: str,
     output_dir: str,
     model: str,
     steps: int,
-    guidance_scale: float
+    guidance_scale: float,
+    fast_png: bool,
+    optimize_png: bool
 ):
     """Generate AI-powered app icons."""
 
@@ -150,7 +170,10 @@ def generate(
                 originals_dir=originals_dir,
                 output_base_dir=output_path,
                 remove_bg=not no_remove_bg,
-                apply_mask=not no_mask
+                apply_mask=not no_mask,
+                quick=fast_png,
+                optimize_png=optimize_png,
+                rembg_model=rembg_model
             )
 
             total_processed = sum(len(paths) for paths in results.values())
@@ -279,6 +302,16 @@ def generate(
     default='black',
     help='Background color for card layout (black, white, or hex like #1a1a1a)'
 )
+@click.option(
+    '--fast-png',
+    is_flag=True,
+    help='Fastest PNG compression (larger files, for quick iterations)'
+)
+@click.option(
+    '--optimize-png',
+    is_flag=True,
+    help='Recompress output PNGs with oxipng (smallest files, requires oxipng)'
+)
 def instagram(
     subject: str,
     style: str,
@@ -296,7 +329,9 @@ def instagram(
     no_text_box: bool,
     text_style: str,
     layout: str,
-    bg_color: str
+    bg_color: str,
+    fast_png: bool,
+    optimize_png: bool
 ):
     """Generate AI-powered Instagram posts."""
 
@@ -383,6 +418,8 @@ def instagram(
             else:
                 parsed_bg_color = (0, 0, 0)
 
+            compress_level, run_oxipng = IconProcessor.png_encoding(fast_png, optimize_png)
+
             if text and layout == 'card':
                 # Card layout: image on top, text below on solid background
                 results = IconProcessor.process_card_layout(
@@ -391,7 +428,8 @@ def instagram(
                     text=text,
                     aspect_ratio=aspect_ratio,
                     bg_color=parsed_bg_color,
-                    text_color=parsed_text_color
+                    text_color=parsed_text_color,
+                    compress_level=compress_level
                 )
             elif text:
                 results = IconProcessor.process_instagram_with_text(
@@ -402,15 +440,20 @@ def instagram(
                     position=text_position,
                     text_color=parsed_text_color,
                     box_color=box_color,
-                    text_style=text_style
+                    text_style=text_style,
+                    compress_level=compress_level
                 )
             else:
                 results = IconProcessor.process_instagram_images(
                     originals_dir=originals_dir,
                     output_base_dir=output_path,
-                    aspect_ratio=aspect_ratio
+                    aspect_ratio=aspect_ratio,
+                    compress_level=compress_level
                 )
 
+            if run_oxipng:
+                IconProcessor.optimize_final([p for paths in results.values() for p in paths])
+
             total_processed = sum(len(paths) for paths in results.values())
             click.echo(f"\n✅ Generated {total_processed} Instagram posts!")
 
@@ -479,6 +522,14 @@ def info():
     for name, (w, h) in Config.INSTAGRAM_SIZES.items():
         click.echo(f"   • {name}: {w}x{h}")
 
+    # Pillow-SIMD releases are versioned as post-releases of Pillow
+    click.echo(f"\nImage Backend:")
+    if ".post" in PIL.__version__:
+        click.echo(f"   Pillow-SIMD {PIL.__version__}")
+    else:
+        click.echo(f"   Pillow {PIL.__version__}")
+        click.echo("   Install pillow-simd for faster resizing (see README)")
+
     click.echo()
 
 
@@ -106,6 +106,9 @@ class Config:
     # Output Directory
     OUTPUT_DIR = Path("output")
 
+    # Release builds run final PNGs through oxipng (set ICON_RELEASE=1)
+    ICON_RELEASE = os.getenv("ICON_RELEASE") == "1"
+
     @classmethod
     def validate(cls):
         """Validate that required configuration is present."""
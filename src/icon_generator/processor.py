@@ -1,23 +1,287 @@
 """Image post-processing for iOS app icons."""
 
+import asyncio
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from PIL import Image, ImageDraw, ImageFont
-from rembg import remove
+from typing import Iterator, List, Optional, Dict, Sequence, Tuple
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from rembg import new_session, remove
 from .config import Config
 
+try:
+    import onnxruntime as ort  # installed by rembg; only used to detect CUDA
+except ImportError:
+    ort = None
+
+# Default rembg model: ~4MB u2netp gives near-identical masks to the full
+# u2net at icon sizes for a fraction of the inference cost
+_REMBG_MODEL = "u2netp"
+
+# rembg models that share U2-Net's 320x320 input and normalization, and can
+# therefore be run as one batched inference call
+_U2NET_MODELS = ("u2net", "u2netp", "u2net_human_seg", "silueta")
+_U2NET_MEAN = (0.485, 0.456, 0.406)
+_U2NET_STD = (0.229, 0.224, 0.225)
+
+# ONNX Runtime providers for background removal, in order of preference
+_REMBG_PROVIDERS = ("CUDAExecutionProvider", "CPUExecutionProvider")
+
+# Variants per background-removal inference call in the icon pipeline
+_REMBG_BATCH_SIZE = 4
+
+# Minimum variants x sizes before the pipeline resizes on the GPU; below
+# this the host/device transfers cost more than they save
+_GPU_RESIZE_THRESHOLD = 64
+
+
+@lru_cache(maxsize=None)
+def _size_plan(sizes: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Resolve the largest-to-smallest resize order once per size set."""
+    return tuple(sorted(sizes, reverse=True))
+
+
+# 3x3 approximation of UnsharpMask(radius=1, percent=50, threshold=0) for
+# final sharpening: the original plus half its difference from a binomial
+# blur. A fixed kernel avoids building a Gaussian blur per call, but has no
+# threshold, so low-contrast noise is sharpened along with edges.
+_UNSHARP_3X3 = ImageFilter.Kernel(
+    (3, 3),
+    [
+        -0.03125, -0.0625, -0.03125,
+        -0.0625, 1.375, -0.0625,
+        -0.03125, -0.0625, -0.03125,
+    ],
+    scale=1
+)
+
+# Fonts for text overlays by family, in order of preference
+_FONT_CANDIDATES = {
+    "serif": [
+        "/System/Library/Fonts/Supplemental/Times New Roman.ttf",
+        "/System/Library/Fonts/Times.ttc",
+        "/Library/Fonts/Georgia.ttf",
+        "/System/Library/Fonts/Supplemental/Georgia.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
+        "/usr/share/fonts/TTF/times.ttf",
+    ],
+    # JetBrains Mono, SF Mono, etc. for the brutalist style
+    "mono": [
+        "/System/Library/Fonts/SFMono-Bold.otf",
+        "/System/Library/Fonts/Supplemental/JetBrains Mono Bold.ttf",
+        "/Library/Fonts/JetBrainsMono-Bold.ttf",
+        "/System/Library/Fonts/Monaco.ttf",
+        "/System/Library/Fonts/Menlo.ttc",
+        "/System/Library/Fonts/Supplemental/Courier New Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
+    ],
+}
+
+# Only the candidates installed on this machine, resolved once at import
+_FONTS = {
+    family: [font_path for font_path in paths if os.path.exists(font_path)]
+    for family, paths in _FONT_CANDIDATES.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _load_font(family: str, size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Load the first available font of a family at size, once per (family, size)."""
+    for font_path in _FONTS[family]:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except (OSError, IOError):
+            continue
+    return None
+
+
+def _open_scaled(path: Path, width: int, height: int) -> Image.Image:
+    """
+    Open an image that will be downscaled to at most width x height.
+
+    JPEG sources are decoded at a reduced DCT scale (1/2, 1/4 or 1/8) that
+    still leaves at least twice the target size; other formats are
+    unaffected.
+    """
+    image = Image.open(path)
+    if image.format == 'JPEG':
+        image.draft('RGB', (width * 2, height * 2))
+    return image
+
+
+def _load_image(path: Path) -> Image.Image:
+    """Decode an image fully and close its file handle."""
+    with Image.open(path) as image:
+        image.load()
+    return image
+
+
+def _flatten_on_bg(
+    image: Image.Image,
+    bg_color: Tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """Composite an RGBA image over a solid color in a single numpy pass."""
+    pixels = np.asarray(image, dtype=np.float32)
+    alpha = pixels[..., 3:] / 255
+    rgb = pixels[..., :3] * alpha + np.asarray(bg_color, dtype=np.float32) * (1 - alpha)
+    return Image.fromarray((rgb + 0.5).astype(np.uint8), 'RGB')
+
+
+def _downscale(image: Image.Image, size: int) -> Image.Image:
+    """
+    Downscale an image to size x size.
+
+    An exact 2x halving of a square image takes the cheap box-average
+    reduce() path. Larger factors would alias with a plain box filter, so
+    they go through LANCZOS, whose reducing_gap already box-reduces most
+    of the way before the final resample.
+    """
+    if image.width == image.height == size * 2:
+        return image.reduce(2)
+    return image.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+@lru_cache(maxsize=8)
+def _list_variants(dir_str: str, mtime_ns: int) -> Tuple[Path, ...]:
+    """Sorted variant originals in a directory, cached per directory mtime."""
+    return tuple(sorted(Path(dir_str).glob("variant-*.png")))
+
+
+def _variant_paths(originals_dir: Path) -> Tuple[Path, ...]:
+    """
+    List the variant originals in a directory.
+
+    Adding or removing a file bumps the directory's mtime, so repeated
+    pipelines over an unchanged directory reuse one listing.
+    """
+    if not originals_dir.is_dir():
+        return ()
+    return _list_variants(str(originals_dir), originals_dir.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _ios_mask(size: int) -> Image.Image:
+    """
+    Build the anti-aliased rounded-corner alpha mask for a size.
+
+    The mask is computed analytically as the signed distance from each
+    pixel centre to the rounded square's edge. The returned image is
+    shared between callers and must not be modified.
+    """
+    # Calculate corner radius (iOS standard)
+    radius = int(size * 0.2237)
+    half = size / 2
+
+    y, x = np.ogrid[:size, :size]
+    qx = np.abs(x + 0.5 - half) - (half - radius)
+    qy = np.abs(y + 0.5 - half) - (half - radius)
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    inside = np.minimum(np.maximum(qx, qy), 0)
+    distance = outside + inside - radius
+
+    # Blend over the one-pixel band that straddles the edge
+    alpha = np.clip(0.5 - distance, 0, 1)
+    return Image.fromarray(np.round(alpha * 255).astype(np.uint8), 'L')
+
+
+@lru_cache(maxsize=None)
+def _rembg_session(model_name: str = _REMBG_MODEL):
+    """
+    Load a rembg model once per process and reuse it for every image.
+
+    Runs on CUDA when onnxruntime-gpu is installed, otherwise on the CPU.
+    """
+    if ort is not None and _REMBG_PROVIDERS[0] in ort.get_available_providers():
+        return new_session(model_name, providers=list(_REMBG_PROVIDERS))
+    return new_session(model_name)
+
+
+def _save_png(
+    image: Image.Image,
+    path: Path,
+    compress_level: int = 6,
+    optimize: bool = False
+) -> None:
+    """
+    Save an image as PNG.
+
+    compress_level trades encode speed for file size:
+
+        level 0    stored, no compression (fastest, largest)
+        level 1    fastest DEFLATE, ~2x larger than level 9
+        level 6    default balance of speed and size
+        level 9    smallest DEFLATE output, several-fold slower
+        optimize   level 9 plus Pillow's filter search (final assets only)
+    """
+    if optimize:
+        image.save(path, 'PNG', optimize=True)
+    else:
+        image.save(path, 'PNG', compress_level=compress_level)
+
+
+def _gpu_resize_enabled(jobs: int) -> bool:
+    """Whether a batch of resize jobs is large enough to run on CUDA."""
+    if jobs <= _GPU_RESIZE_THRESHOLD:
+        return False
+    # Imported only for large batches so ordinary runs skip torch's startup
+    try:
+        import torch  # CUDA resizing (optional "gpu" extra)
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def _pool_size(jobs: int, max_workers: Optional[int] = None) -> int:
+    """Number of workers for a batch of independent jobs."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(jobs, max_workers))
+
 
 class IconProcessor:
     """Handles image post-processing and multi-size generation."""
 
     @staticmethod
-    def remove_background(image_path: Path, output_path: Optional[Path] = None) -> Path:
+    def remove_background_image(
+        image: Image.Image,
+        session=None,
+        model_name: str = _REMBG_MODEL
+    ) -> Image.Image:
+        """
+        Remove background from an in-memory image using rembg.
+
+        Args:
+            image: PIL Image to cut out
+            session: rembg session to reuse (defaults to the per-process session)
+            model_name: rembg model to use when no session is given
+
+        Returns:
+            RGBA cutout with a transparent background
+        """
+        if session is None:
+            session = _rembg_session(model_name)
+        return remove(image, session=session)
+
+    @staticmethod
+    def remove_background(
+        image_path: Path,
+        output_path: Optional[Path] = None,
+        session=None,
+        model_name: str = _REMBG_MODEL
+    ) -> Path:
         """
         Remove background from an image using rembg.
 
         Args:
             image_path: Path to input image
             output_path: Path to save processed image (optional)
+            session: rembg session to reuse (defaults to the per-process session)
+            model_name: rembg model to use when no session is given
 
         Returns:
             Path to the processed image
@@ -25,15 +289,58 @@ class IconProcessor:
         if output_path is None:
             output_path = image_path.parent / f"{image_path.stem}_nobg.png"
 
-        with open(image_path, 'rb') as input_file:
-            input_data = input_file.read()
-            output_data = remove(input_data)
-
-        with open(output_path, 'wb') as output_file:
-            output_file.write(output_data)
+        with Image.open(image_path) as image:
+            cutout = IconProcessor.remove_background_image(image, session, model_name)
+        _save_png(cutout, output_path)
 
         return output_path
 
+    @staticmethod
+    def remove_background_batch(
+        images: List[Image.Image],
+        session=None,
+        model_name: str = _REMBG_MODEL
+    ) -> List[Image.Image]:
+        """
+        Remove backgrounds from several images with a single model inference.
+
+        U2-Net family models run once on a (B, 3, 320, 320) batch instead of
+        once per image. Other models, or models exported with a fixed batch
+        size, fall back to one rembg call per image.
+
+        Args:
+            images: PIL Images to cut out
+            session: rembg session to reuse (defaults to the per-process session)
+            model_name: rembg model to use when no session is given
+
+        Returns:
+            Cutout images with transparent backgrounds, in input order
+        """
+        if session is None:
+            session = _rembg_session(model_name)
+
+        model_input = session.inner_session.get_inputs()[0]
+        if session.model_name not in _U2NET_MODELS or isinstance(model_input.shape[0], int):
+            return [remove(image, session=session) for image in images]
+
+        batch = np.concatenate([
+            session.normalize(image, _U2NET_MEAN, _U2NET_STD, (320, 320))[model_input.name]
+            for image in images
+        ])
+        predictions = session.inner_session.run(None, {model_input.name: batch})[0][:, 0, :, :]
+
+        cutouts = []
+        for image, pred in zip(images, predictions):
+            # Same per-image min-max scaling rembg applies to a single prediction
+            pred = (pred - pred.min()) / (pred.max() - pred.min())
+            mask = Image.fromarray((pred.clip(0, 1) * 255).astype(np.uint8), 'L')
+            mask = mask.resize(image.size, Image.Resampling.LANCZOS)
+
+            empty = Image.new('RGBA', image.size, 0)
+            cutouts.append(Image.composite(image, empty, mask))
+
+        return cutouts
+
     @staticmethod
     def apply_ios_mask(image: Image.Image, size: int) -> Image.Image:
         """
@@ -43,27 +350,22 @@ class IconProcessor:
         Approximation: radius ≈ size * 0.2237 (22.37% of size)
 
         Args:
-            image: PIL Image to mask
+            image: PIL Image to mask (resized to size if not already)
             size: Target size (width/height)
 
         Returns:
             Masked PIL Image with transparency
         """
-        # Resize image to target size
-        image = image.resize((size, size), Image.Resampling.LANCZOS)
-
-        # Calculate corner radius (iOS standard)
-        radius = int(size * 0.2237)
-
-        # Create a mask with rounded corners
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.rounded_rectangle([(0, 0), (size, size)], radius=radius, fill=255)
+        # Resize into a new image, or copy so the caller's image is untouched
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        if image.size != (size, size):
+            output = image.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        else:
+            output = image.copy()
 
-        # Apply mask to image
-        output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        output.paste(image, (0, 0))
-        output.putalpha(mask)
+        # Rounded-corner mask is cached per size; putalpha copies it in
+        output.putalpha(_ios_mask(size))
 
         return output
 
@@ -73,73 +375,238 @@ class IconProcessor:
         output_dir: Path,
         sizes: Optional[List[int]] = None,
         apply_mask: bool = True,
-        remove_bg: bool = False
+        remove_bg: bool = False,
+        image: Optional[Image.Image] = None,
+        compress_level: int = 6,
+        session=None,
+        quick: bool = False,
+        raw_output: bool = False
     ) -> List[Path]:
         """
         Generate all iOS app icon sizes from a source image.
 
+        Intermediate sizes are written at compress_level; only the largest
+        (App Store) icon gets the slower optimized PNG encode. quick=True
+        writes every size at compress_level=1 for fast iteration.
+        raw_output=True writes uncompressed PNGs for a later
+        optimize_final pass, so generation never waits on DEFLATE.
+
         Args:
             input_path: Path to source image
             output_dir: Directory to save resized icons
             sizes: List of sizes to generate (defaults to Config.IOS_ICON_SIZES)
             apply_mask: Whether to apply iOS rounded corner mask
             remove_bg: Whether to remove background first
+            image: Already-decoded source image (skips reading input_path)
+            compress_level: PNG compression level (0-9) for intermediate sizes
+            session: rembg session to reuse for background removal
+            quick: Fastest PNG encode (larger files), e.g. for dev runs
+            raw_output: Write stored (level 0) PNGs to be recompressed later
 
         Returns:
             List of paths to generated icon files
         """
         if sizes is None:
             sizes = Config.IOS_ICON_SIZES
+        if quick:
+            compress_level = 1
+        if raw_output:
+            compress_level = 0
 
         output_dir.mkdir(parents=True, exist_ok=True)
+        if not sizes:
+            return []
 
-        # Load the source image
-        image = Image.open(input_path)
+        # Load the source image unless the caller already decoded it
+        if image is None:
+            image = _open_scaled(input_path, max(sizes), max(sizes))
 
         # Remove background if requested
         if remove_bg:
             print("🔄 Removing background...")
-            temp_path = output_dir / "temp_nobg.png"
-            temp_path = IconProcessor.remove_background(input_path, temp_path)
-            image = Image.open(temp_path)
-            temp_path.unlink()  # Clean up temp file
+            image = IconProcessor.remove_background_image(image, session=session)
+
+        # Masking and PNG encoding release the GIL, so each size is finished
+        # in a thread as soon as it is resized, overlapping the next resize
+        largest = max(sizes)
+        with ThreadPoolExecutor(_pool_size(len(sizes))) as executor:
+            futures = [
+                executor.submit(
+                    IconProcessor._finish_size,
+                    level, size, apply_mask, output_dir,
+                    compress_level=compress_level,
+                    optimize=(not (quick or raw_output) and size == largest)
+                )
+                for size, level in IconProcessor._iter_pyramid(image, sizes)
+            ]
+            generated_paths = [future.result() for future in futures]
+
+        return generated_paths
+
+    @staticmethod
+    def _build_pyramid(image: Image.Image, sizes: List[int]) -> List[Tuple[int, Image.Image]]:
+        """Resize an image to every icon size, largest first."""
+        return list(IconProcessor._iter_pyramid(image, sizes))
+
+    @staticmethod
+    def _iter_pyramid(image: Image.Image, sizes: List[int]) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Resize an image to every icon size, yielding levels largest first.
+
+        Cascades downwards so each size is resampled from the previous
+        (larger) result rather than the full-resolution source, as long as
+        that step is at most a 2x reduction; larger jumps resample from
+        the source to avoid compounding filter error.
 
+        A level is yielded only once the next one has been resampled from
+        it, so consumers may mask it in place while resizing continues.
+        """
         # Ensure RGBA mode
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
 
-        generated_paths = []
+        previous = None
+        current = image
+        for size in _size_plan(tuple(sizes)):
+            print(f"📐 Generating {size}x{size}...")
+            base = current if current.width <= size * 2 else image
+            current = _downscale(base, size)
+            if previous is not None:
+                yield previous
+            previous = (size, current)
+
+        if previous is not None:
+            yield previous
+
+    @staticmethod
+    def _build_pyramid_gpu(image: Image.Image, sizes: List[int]) -> List[Tuple[int, Image.Image]]:
+        """
+        Resize an image to every icon size on the GPU, largest first.
 
-        for size in sorted(sizes, reverse=True):
+        The source is uploaded once and each size is resampled directly
+        from it. Tensor resizing has no LANCZOS kernel, so this uses
+        antialiased bicubic on premultiplied alpha (as Pillow does for
+        RGBA), which is visually indistinguishable at icon sizes.
+        """
+        import torch
+        from torchvision.transforms import InterpolationMode
+        from torchvision.transforms import functional as TF
+
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+
+        # A writable copy; torch warns when wrapping read-only arrays
+        pixels = torch.from_numpy(np.array(image)).cuda(non_blocking=True)
+        source = pixels.permute(2, 0, 1).float()
+        alpha = source[3:] / 255
+        source = torch.cat((source[:3] * alpha, source[3:]))
+
+        pyramid = []
+        for size in _size_plan(tuple(sizes)):
             print(f"📐 Generating {size}x{size}...")
+            level = TF.resize(source, [size, size], InterpolationMode.BICUBIC, antialias=True)
+            alpha = level[3:].clamp(0, 255)
+            rgb = level[:3] * 255 / alpha.clamp(min=1e-3)
+            level = torch.cat((rgb.clamp(0, 255), alpha)).round().to(torch.uint8)
+            pyramid.append((size, Image.fromarray(level.permute(1, 2, 0).cpu().numpy(), 'RGBA')))
 
-            if apply_mask:
-                resized = IconProcessor.apply_ios_mask(image, size)
-            else:
-                resized = image.resize((size, size), Image.Resampling.LANCZOS)
+        return pyramid
 
-            # Save with optimized PNG compression
-            output_path = output_dir / f"AppIcon-{size}.png"
-            resized.save(output_path, 'PNG', optimize=True)
-            generated_paths.append(output_path)
+    @staticmethod
+    def _finish_size(
+        image: Image.Image,
+        size: int,
+        apply_mask: bool,
+        output_dir: Path,
+        compress_level: int = 6,
+        optimize: bool = False
+    ) -> Path:
+        """Mask (optionally) and save one already-resized icon size."""
+        if apply_mask:
+            # The pyramid level is already at size, so only the alpha changes
+            image.putalpha(_ios_mask(size))
+
+        output_path = output_dir / f"AppIcon-{size}.png"
+        _save_png(image, output_path, compress_level=compress_level, optimize=optimize)
+        return output_path
 
-        return generated_paths
+    @staticmethod
+    def optimize_final(paths: List[Path], level: int = 4) -> None:
+        """
+        Losslessly recompress final PNGs in place with oxipng.
+
+        Non-rendering metadata chunks are stripped; pairs with the
+        raw_output mode of generate_all_sizes.
+
+        Skipped with a warning when the oxipng binary is not on PATH.
+
+        Args:
+            paths: PNG files to optimize
+            level: oxipng optimization level (0-6)
+        """
+        oxipng = shutil.which("oxipng")
+        if oxipng is None:
+            print("⚠️  oxipng not found, skipping PNG optimization")
+            return
+        if not paths:
+            return
+
+        print(f"\n🗜️  Optimizing {len(paths)} PNGs with oxipng...")
+        subprocess.run([oxipng, "-o", str(level), "--strip", "safe", *map(str, paths)], check=True)
+
+    @staticmethod
+    def png_encoding(quick: bool = False, optimize_png: bool = False) -> Tuple[int, bool]:
+        """
+        Choose the PNG compress_level and whether to run optimize_final.
+
+        Release builds (ICON_RELEASE=1 or optimize_png) are recompressed by
+        oxipng afterwards, so they skip DEFLATE entirely when oxipng is
+        available; without it they keep the normal encode.
+
+        Args:
+            quick: Fastest PNG encode (larger files), e.g. for dev runs
+            optimize_png: Recompress the output with oxipng
+
+        Returns:
+            (compress_level, run_oxipng) tuple
+        """
+        release = Config.ICON_RELEASE or optimize_png
+        if release and shutil.which("oxipng") is not None:
+            return 0, True
+        return (1 if quick else 6), release
 
     @staticmethod
     def process_generated_icons(
         originals_dir: Path,
         output_base_dir: Path,
         remove_bg: bool = True,
-        apply_mask: bool = True
+        apply_mask: bool = True,
+        max_workers: Optional[int] = None,
+        quick: bool = False,
+        optimize_png: bool = False,
+        rembg_model: str = _REMBG_MODEL
     ) -> Dict[str, List[Path]]:
         """
         Process all generated icons from the originals directory.
 
+        Variants flow through a three-stage pipeline so that one variant
+        is resized while the next has its background removed and the
+        previous is being encoded:
+
+            1. background removal (one thread; batched model inference)
+            2. resize pyramid (thread pool; on CUDA for large batches when
+               torch is installed)
+            3. mask + PNG encode (thread pool)
+
         Args:
             originals_dir: Directory containing original generated images
             output_base_dir: Base output directory
             remove_bg: Whether to remove backgrounds
             apply_mask: Whether to apply iOS masks
+            max_workers: Maximum threads per resize/encode stage (defaults to CPU count)
+            quick: Fastest PNG encode (larger files), e.g. for dev runs
+            optimize_png: Recompress the output with oxipng, as ICON_RELEASE=1 does
+            rembg_model: rembg model for background removal
 
         Returns:
             Dictionary mapping variant names to lists of generated paths
@@ -147,29 +614,122 @@ class IconProcessor:
         processed_dir = output_base_dir / "processed"
         processed_dir.mkdir(parents=True, exist_ok=True)
 
-        results = {}
-
         # Process each variant
-        original_images = sorted(originals_dir.glob("variant-*.png"))
-
-        for idx, original_path in enumerate(original_images, 1):
-            variant_name = original_path.stem
-            print(f"\n🎨 Processing {variant_name}...")
-
-            # Create variant subdirectory
-            variant_dir = processed_dir / variant_name
-            variant_dir.mkdir(exist_ok=True)
-
-            # Generate all sizes
-            paths = IconProcessor.generate_all_sizes(
-                input_path=original_path,
-                output_dir=variant_dir,
-                remove_bg=remove_bg,
-                apply_mask=apply_mask
-            )
+        original_images = _variant_paths(originals_dir)
 
-            results[variant_name] = paths
-            print(f"✅ Processed {len(paths)} sizes for {variant_name}")
+        compress_level, run_oxipng = IconProcessor.png_encoding(quick, optimize_png)
+
+        # Only the default encode spends extra time on the App Store icon
+        results = asyncio.run(IconProcessor._icon_pipeline(
+            original_images, processed_dir, remove_bg, apply_mask, max_workers,
+            compress_level=compress_level, optimize_largest=(compress_level == 6),
+            rembg_model=rembg_model
+        ))
+
+        if run_oxipng:
+            IconProcessor.optimize_final([p for paths in results.values() for p in paths])
+
+        # Keep variant order stable regardless of completion order
+        return {path.stem: results[path.stem] for path in original_images}
+
+    @staticmethod
+    async def _icon_pipeline(
+        original_images: Sequence[Path],
+        processed_dir: Path,
+        remove_bg: bool,
+        apply_mask: bool,
+        max_workers: Optional[int] = None,
+        compress_level: int = 6,
+        optimize_largest: bool = True,
+        rembg_model: str = _REMBG_MODEL
+    ) -> Dict[str, List[Path]]:
+        """Run background removal, resizing and encoding as overlapping stages."""
+        loop = asyncio.get_running_loop()
+        sizes = Config.IOS_ICON_SIZES
+        workers = _pool_size(max(len(original_images), len(sizes)), max_workers)
+        if _gpu_resize_enabled(len(original_images) * len(sizes)):
+            print("⚡ Resizing on GPU")
+            build_pyramid = IconProcessor._build_pyramid_gpu
+        else:
+            build_pyramid = IconProcessor._build_pyramid
+
+        # Cap the variants held in memory between decode and encode; at
+        # least one rembg batch so a full batch can always be admitted
+        in_flight_limit = max(workers, _REMBG_BATCH_SIZE)
+        in_flight = asyncio.Semaphore(in_flight_limit)
+        decoded = asyncio.Queue(maxsize=in_flight_limit)
+        resized = asyncio.Queue(maxsize=in_flight_limit)
+        results = {}
+
+        with ThreadPoolExecutor(1) as rembg_pool, \
+                ThreadPoolExecutor(workers) as resize_pool, \
+                ThreadPoolExecutor(workers) as encode_pool:
+
+            async def remove_backgrounds():
+                # Small batches keep inference batched while still feeding
+                # the resize stage before every background is done
+                for start in range(0, len(original_images), _REMBG_BATCH_SIZE):
+                    batch = original_images[start:start + _REMBG_BATCH_SIZE]
+                    for _ in batch:
+                        await in_flight.acquire()
+                    images = await asyncio.gather(*(
+                        loop.run_in_executor(resize_pool, _load_image, path)
+                        for path in batch
+                    ))
+                    if remove_bg:
+                        print(f"\n🔄 Removing backgrounds from {len(batch)} variants...")
+                        images = await loop.run_in_executor(
+                            rembg_pool,
+                            partial(IconProcessor.remove_background_batch, model_name=rembg_model),
+                            images
+                        )
+                    for path, image in zip(batch, images):
+                        await decoded.put((path, image))
+                await decoded.put(None)
+
+            async def resize_one(path: Path, image: Image.Image):
+                print(f"\n🎨 Processing {path.stem}...")
+                pyramid = await loop.run_in_executor(
+                    resize_pool, build_pyramid, image, sizes
+                )
+                await resized.put((path, pyramid))
+
+            async def resize_all():
+                tasks = []
+                while (item := await decoded.get()) is not None:
+                    tasks.append(asyncio.ensure_future(resize_one(*item)))
+                await asyncio.gather(*tasks)
+                await resized.put(None)
+
+            async def encode_one(path: Path, pyramid: List[Tuple[int, Image.Image]]):
+                # Create variant subdirectory
+                variant_dir = processed_dir / path.stem
+                variant_dir.mkdir(exist_ok=True)
+
+                largest = pyramid[0][0]
+                paths = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        encode_pool,
+                        partial(
+                            IconProcessor._finish_size,
+                            compress_level=compress_level,
+                            optimize=(optimize_largest and size == largest)
+                        ),
+                        level, size, apply_mask, variant_dir
+                    )
+                    for size, level in pyramid
+                ))
+                results[path.stem] = list(paths)
+                in_flight.release()
+                print(f"✅ Processed {len(paths)} sizes for {path.stem}")
+
+            async def encode_all():
+                tasks = []
+                while (item := await resized.get()) is not None:
+                    tasks.append(asyncio.ensure_future(encode_one(*item)))
+                await asyncio.gather(*tasks)
+
+            await asyncio.gather(remove_backgrounds(), resize_all(), encode_all())
 
         return results
 
@@ -177,7 +737,9 @@ class IconProcessor:
     def generate_instagram_sizes(
         input_path: Path,
         output_dir: Path,
-        aspect_ratio: str = "square"
+        aspect_ratio: str = "square",
+        image: Optional[Image.Image] = None,
+        compress_level: int = 6
     ) -> List[Path]:
         """
         Generate Instagram-optimized images (no masking, proper dimensions).
@@ -186,39 +748,39 @@ class IconProcessor:
             input_path: Path to source image
             output_dir: Directory to save resized images
             aspect_ratio: Instagram aspect ratio (square, portrait, landscape, story)
+            image: Already-decoded source image (skips reading input_path)
+            compress_level: PNG compression level (0-9)
 
         Returns:
             List of paths to generated image files
         """
-        from PIL import ImageFilter
-
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Get target dimensions
         target_size = Config.INSTAGRAM_SIZES.get(aspect_ratio, (1080, 1080))
         target_width, target_height = target_size
 
-        # Load the source image
-        image = Image.open(input_path)
+        # Load the source image unless the caller already decoded it
+        if image is None:
+            image = _open_scaled(input_path, target_width, target_height)
 
-        # Ensure RGB mode for Instagram (no transparency needed)
-        if image.mode == 'RGBA':
-            # Create white background for transparency
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[3])
-            image = background
-        elif image.mode != 'RGB':
+        if image.mode not in ('RGB', 'RGBA'):
             image = image.convert('RGB')
 
         # Resize to target dimensions
-        resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+        # Ensure RGB mode for Instagram (no transparency needed); flattening
+        # after the resize composites target-size pixels, not the source
+        if resized.mode == 'RGBA':
+            resized = _flatten_on_bg(resized)
 
         # Apply slight sharpening for social media clarity
-        sharpened = resized.filter(ImageFilter.UnsharpMask(radius=1, percent=50, threshold=3))
+        sharpened = resized.filter(_UNSHARP_3X3)
 
-        # Save with high quality
+        # Save
         output_path = output_dir / f"post-{target_width}x{target_height}.png"
-        sharpened.save(output_path, 'PNG', optimize=True)
+        _save_png(sharpened, output_path, compress_level=compress_level)
 
         return [output_path]
 
@@ -226,7 +788,9 @@ class IconProcessor:
     def process_instagram_images(
         originals_dir: Path,
         output_base_dir: Path,
-        aspect_ratio: str = "square"
+        aspect_ratio: str = "square",
+        max_workers: Optional[int] = None,
+        compress_level: int = 6
     ) -> Dict[str, List[Path]]:
         """
         Process all generated images for Instagram output.
@@ -235,6 +799,8 @@ class IconProcessor:
             originals_dir: Directory containing original generated images
             output_base_dir: Base output directory
             aspect_ratio: Instagram aspect ratio
+            max_workers: Maximum worker threads (defaults to CPU count)
+            compress_level: PNG compression level (0-9)
 
         Returns:
             Dictionary mapping variant names to lists of generated paths
@@ -245,27 +811,37 @@ class IconProcessor:
         results = {}
 
         # Process each variant
-        original_images = sorted(originals_dir.glob("variant-*.png"))
-
-        for idx, original_path in enumerate(original_images, 1):
-            variant_name = original_path.stem
-            print(f"\n📸 Processing {variant_name} for Instagram...")
-
-            # Create variant subdirectory
-            variant_dir = instagram_dir / variant_name
-            variant_dir.mkdir(exist_ok=True)
-
-            # Generate Instagram size
-            paths = IconProcessor.generate_instagram_sizes(
-                input_path=original_path,
-                output_dir=variant_dir,
-                aspect_ratio=aspect_ratio
-            )
-
-            results[variant_name] = paths
-            print(f"✅ Processed Instagram image for {variant_name}")
-
-        return results
+        original_images = _variant_paths(originals_dir)
+
+        # Resize, filtering and PNG encoding release the GIL, so threads
+        # parallelize them without re-importing this module per worker
+        with ThreadPoolExecutor(_pool_size(len(original_images), max_workers)) as executor:
+            futures = {}
+            for original_path in original_images:
+                variant_name = original_path.stem
+                print(f"\n📸 Processing {variant_name} for Instagram...")
+
+                # Create variant subdirectory
+                variant_dir = instagram_dir / variant_name
+                variant_dir.mkdir(exist_ok=True)
+
+                # Generate Instagram size
+                future = executor.submit(
+                    IconProcessor.generate_instagram_sizes,
+                    input_path=original_path,
+                    output_dir=variant_dir,
+                    aspect_ratio=aspect_ratio,
+                    compress_level=compress_level
+                )
+                futures[future] = variant_name
+
+            for future in as_completed(futures):
+                variant_name = futures[future]
+                results[variant_name] = future.result()
+                print(f"✅ Processed Instagram image for {variant_name}")
+
+        # Keep variant order stable regardless of completion order
+        return {path.stem: results[path.stem] for path in original_images}
 
     @staticmethod
     def add_text_overlay(
@@ -277,7 +853,8 @@ class IconProcessor:
         font_size: Optional[int] = None,
         padding: int = 40,
         margin: int = 60,
-        style: str = "classic"
+        style: str = "classic",
+        inplace: bool = False
     ) -> Image.Image:
         """
         Add text overlay to an image.
@@ -292,11 +869,14 @@ class IconProcessor:
             padding: Padding inside text box
             margin: Margin from edge of image
             style: "classic" (serif) or "brutalist" (monospace, bold, wide tracking)
+            inplace: Draw onto image itself instead of a copy (for callers
+                that discard the input)
 
         Returns:
             Image with text overlay
         """
-        image = image.copy()
+        if not inplace:
+            image = image.copy()
         draw = ImageDraw.Draw(image)
         width, height = image.size
 
@@ -308,42 +888,14 @@ class IconProcessor:
             letter_spacing = 0.12  # Wide tracking
             text = text.upper()  # Brutalist often uses uppercase
 
-            # Try to load monospace fonts (JetBrains Mono, SF Mono, etc.)
-            font = None
-            mono_fonts = [
-                "/System/Library/Fonts/SFMono-Bold.otf",
-                "/System/Library/Fonts/Supplemental/JetBrains Mono Bold.ttf",
-                "/Library/Fonts/JetBrainsMono-Bold.ttf",
-                "/System/Library/Fonts/Monaco.ttf",
-                "/System/Library/Fonts/Menlo.ttc",
-                "/System/Library/Fonts/Supplemental/Courier New Bold.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
-            ]
-            for font_path in mono_fonts:
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-                except (OSError, IOError):
-                    continue
+            font = _load_font("mono", font_size)
         else:
             # Classic: serif font
             if font_size is None:
                 font_size = int(width * 0.045)
             letter_spacing = 0
 
-            font = None
-            serif_fonts = [
-                "/System/Library/Fonts/Supplemental/Times New Roman.ttf",
-                "/System/Library/Fonts/Times.ttc",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
-                "/usr/share/fonts/TTF/times.ttf",
-            ]
-            for font_path in serif_fonts:
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-                except (OSError, IOError):
-                    continue
+            font = _load_font("serif", font_size)
 
         if font is None:
             font = ImageFont.load_default()
@@ -352,7 +904,7 @@ class IconProcessor:
         # Use larger margins for brutalist style to ensure text fits
         effective_margin = margin * 1.5 if style == "brutalist" else margin
         max_text_width = width - (int(effective_margin) * 2) - (padding * 2)
-        lines = IconProcessor._wrap_text(text, font, max_text_width, draw, letter_spacing)
+        lines = IconProcessor._wrap_text(text, font, max_text_width, letter_spacing)
 
         # Calculate total text block height
         line_height = font_size * 1.4
@@ -389,7 +941,7 @@ class IconProcessor:
         for line in lines:
             if letter_spacing > 0:
                 # Draw with letter spacing
-                line_width = IconProcessor._get_text_width_with_spacing(line, font, letter_spacing, draw)
+                line_width = IconProcessor._get_text_width_with_spacing(line, font, letter_spacing)
                 line_x = box_x + (box_width - line_width) // 2
                 # Draw shadow first if needed
                 if add_shadow:
@@ -409,51 +961,48 @@ class IconProcessor:
         return image
 
     @staticmethod
-    def _get_text_width_with_spacing(text: str, font: ImageFont.ImageFont, spacing: float, draw: ImageDraw.ImageDraw) -> int:
+    def _get_text_width_with_spacing(text: str, font: ImageFont.ImageFont, spacing: float) -> int:
         """Calculate text width with letter spacing."""
-        total_width = 0
-        for i, char in enumerate(text):
-            bbox = draw.textbbox((0, 0), char, font=font)
-            char_width = bbox[2] - bbox[0]
-            total_width += char_width
-            if i < len(text) - 1:
-                # Add spacing based on font size
-                total_width += int(font.size * spacing)
-        return total_width
+        # Spacing (based on font size) goes between characters, not after the last
+        gaps = max(len(text) - 1, 0)
+        return int(font.getlength(text) + gaps * int(font.size * spacing))
 
     @staticmethod
     def _draw_text_with_spacing(draw: ImageDraw.ImageDraw, x: int, y: int, text: str, font: ImageFont.ImageFont, color: Tuple[int, int, int], spacing: float):
         """Draw text with letter spacing."""
-        current_x = x
-        for i, char in enumerate(text):
-            draw.text((current_x, y), char, fill=color, font=font)
-            bbox = draw.textbbox((0, 0), char, font=font)
-            char_width = bbox[2] - bbox[0]
-            current_x += char_width
-            if i < len(text) - 1:
-                current_x += int(font.size * spacing)
+        gap = int(font.size * spacing)
+        advances = [font.getlength(char) + gap for char in text]
+        for char, offset in zip(text, accumulate(advances, initial=0)):
+            draw.text((x + offset, y), char, fill=color, font=font)
 
     @staticmethod
-    def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int, draw: ImageDraw.ImageDraw, letter_spacing: float = 0) -> List[str]:
+    def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int, letter_spacing: float = 0) -> List[str]:
         """Wrap text to fit within max_width."""
         words = text.split()
+        gap = int(font.size * letter_spacing) if letter_spacing > 0 else 0
+
+        # Measure each word once, then pack greedily with a running width
+        word_widths = [font.getlength(word) + gap * (len(word) - 1) for word in words]
+        space_width = font.getlength(' ') + gap * 2
+
         lines = []
         current_line = []
+        current_width = 0
 
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if letter_spacing > 0:
-                line_width = IconProcessor._get_text_width_with_spacing(test_line, font, letter_spacing, draw)
+        for word, word_width in zip(words, word_widths):
+            if current_line:
+                line_width = current_width + space_width + word_width
             else:
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                line_width = bbox[2] - bbox[0]
+                line_width = word_width
 
             if line_width <= max_width:
                 current_line.append(word)
+                current_width = line_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             lines.append(' '.join(current_line))
@@ -468,7 +1017,8 @@ class IconProcessor:
         aspect_ratio: str = "square",
         bg_color: Tuple[int, int, int] = (0, 0, 0),
         text_color: Tuple[int, int, int] = (255, 255, 255),
-        image_ratio: float = 0.6
+        image_ratio: float = 0.6,
+        compress_level: int = 6
     ) -> List[Path]:
         """
         Generate card layout with image on top, text below on solid background.
@@ -482,6 +1032,7 @@ class IconProcessor:
             bg_color: Background color (default black)
             text_color: Text color (default white)
             image_ratio: Portion of height for image (0.0-1.0, default 0.6)
+            compress_level: PNG compression level (0-9)
 
         Returns:
             List of output paths
@@ -498,12 +1049,10 @@ class IconProcessor:
         canvas = Image.new('RGB', (target_width, target_height), bg_color)
 
         # Load image
-        image = Image.open(input_path)
+        image = _open_scaled(input_path, target_width, target_height)
         if image.mode == 'RGBA':
             # Use bg_color for transparency
-            background = Image.new('RGB', image.size, bg_color)
-            background.paste(image, mask=image.split()[3])
-            image = background
+            image = _flatten_on_bg(image, bg_color)
         elif image.mode != 'RGB':
             image = image.convert('RGB')
 
@@ -520,7 +1069,7 @@ class IconProcessor:
             target_img_height = image_area_height
             target_img_width = int(image_area_height * img_aspect)
 
-        resized_img = image.resize((target_img_width, target_img_height), Image.Resampling.LANCZOS)
+        resized_img = image.resize((target_img_width, target_img_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
 
         # Center image horizontally, position at top
         img_x = (target_width - target_img_width) // 2
@@ -533,20 +1082,7 @@ class IconProcessor:
 
         # Load serif font
         font_size = int(target_width * 0.042)  # Clean readable size
-        font = None
-        serif_fonts = [
-            "/System/Library/Fonts/Supplemental/Times New Roman.ttf",
-            "/System/Library/Fonts/Times.ttc",
-            "/Library/Fonts/Georgia.ttf",
-            "/System/Library/Fonts/Supplemental/Georgia.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
-        ]
-        for font_path in serif_fonts:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except (OSError, IOError):
-                continue
+        font = _load_font("serif", font_size)
         if font is None:
             font = ImageFont.load_default()
 
@@ -556,7 +1092,7 @@ class IconProcessor:
         max_text_width = target_width - (text_margin * 2)
 
         # Wrap text
-        lines = IconProcessor._wrap_text(text, font, max_text_width, draw)
+        lines = IconProcessor._wrap_text(text, font, max_text_width)
 
         # Draw text lines (left-aligned)
         line_height = font_size * 1.5
@@ -567,7 +1103,7 @@ class IconProcessor:
 
         # Save
         output_path = output_dir / f"post-{target_width}x{target_height}.png"
-        canvas.save(output_path, 'PNG', optimize=True)
+        _save_png(canvas, output_path, compress_level=compress_level)
 
         return [output_path]
 
@@ -579,7 +1115,9 @@ class IconProcessor:
         aspect_ratio: str = "square",
         bg_color: Tuple[int, int, int] = (0, 0, 0),
         text_color: Tuple[int, int, int] = (255, 255, 255),
-        image_ratio: float = 0.6
+        image_ratio: float = 0.6,
+        compress_level: int = 6,
+        max_workers: Optional[int] = None
     ) -> Dict[str, List[Path]]:
         """
         Process all images with card layout (image top, text bottom).
@@ -592,6 +1130,8 @@ class IconProcessor:
             bg_color: Background color
             text_color: Text color
             image_ratio: Portion of height for image
+            compress_level: PNG compression level (0-9)
+            max_workers: Maximum worker threads (defaults to CPU count)
 
         Returns:
             Dictionary mapping variant names to lists of generated paths
@@ -600,29 +1140,37 @@ class IconProcessor:
         instagram_dir.mkdir(parents=True, exist_ok=True)
 
         results = {}
-        original_images = sorted(originals_dir.glob("variant-*.png"))
-
-        for idx, original_path in enumerate(original_images, 1):
-            variant_name = original_path.stem
-            print(f"\n📸 Processing {variant_name} with card layout...")
-
-            variant_dir = instagram_dir / variant_name
-            variant_dir.mkdir(exist_ok=True)
-
-            paths = IconProcessor.generate_card_layout(
-                input_path=original_path,
-                output_dir=variant_dir,
-                text=text,
-                aspect_ratio=aspect_ratio,
-                bg_color=bg_color,
-                text_color=text_color,
-                image_ratio=image_ratio
-            )
-
-            results[variant_name] = paths
-            print(f"✅ Processed card layout for {variant_name}")
-
-        return results
+        original_images = _variant_paths(originals_dir)
+
+        with ThreadPoolExecutor(_pool_size(len(original_images), max_workers)) as executor:
+            futures = {}
+            for original_path in original_images:
+                variant_name = original_path.stem
+                print(f"\n📸 Processing {variant_name} with card layout...")
+
+                variant_dir = instagram_dir / variant_name
+                variant_dir.mkdir(exist_ok=True)
+
+                future = executor.submit(
+                    IconProcessor.generate_card_layout,
+                    input_path=original_path,
+                    output_dir=variant_dir,
+                    text=text,
+                    aspect_ratio=aspect_ratio,
+                    bg_color=bg_color,
+                    text_color=text_color,
+                    image_ratio=image_ratio,
+                    compress_level=compress_level
+                )
+                futures[future] = variant_name
+
+            for future in as_completed(futures):
+                variant_name = futures[future]
+                results[variant_name] = future.result()
+                print(f"✅ Processed card layout for {variant_name}")
+
+        # Keep variant order stable regardless of completion order
+        return {path.stem: results[path.stem] for path in original_images}
 
     @staticmethod
     def generate_instagram_with_text(
@@ -633,7 +1181,8 @@ class IconProcessor:
         position: str = "top",
         text_color: Tuple[int, int, int] = (0, 0, 0),
         box_color: Optional[Tuple[int, int, int]] = (255, 255, 255),
-        text_style: str = "classic"
+        text_style: str = "classic",
+        compress_level: int = 6
     ) -> List[Path]:
         """
         Generate Instagram image with text overlay.
@@ -647,12 +1196,11 @@ class IconProcessor:
             text_color: RGB color for text
             box_color: RGB color for text box background (None for no box)
             text_style: "classic" (serif) or "brutalist" (monospace, bold)
+            compress_level: PNG compression level (0-9)
 
         Returns:
             List of output paths
         """
-        from PIL import ImageFilter
-
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Get target dimensions
@@ -660,16 +1208,16 @@ class IconProcessor:
         target_width, target_height = target_size
 
         # Load and resize image
-        image = Image.open(input_path)
+        image = _open_scaled(input_path, target_width, target_height)
 
-        if image.mode == 'RGBA':
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[3])
-            image = background
-        elif image.mode != 'RGB':
+        if image.mode not in ('RGB', 'RGBA'):
             image = image.convert('RGB')
 
-        resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+        # Flatten transparency onto white at the target size
+        if resized.mode == 'RGBA':
+            resized = _flatten_on_bg(resized)
 
         # Add text overlay
         with_text = IconProcessor.add_text_overlay(
@@ -678,15 +1226,16 @@ class IconProcessor:
             position=position,
             text_color=text_color,
             box_color=box_color,
-            style=text_style
+            style=text_style,
+            inplace=True
         )
 
         # Apply slight sharpening
-        sharpened = with_text.filter(ImageFilter.UnsharpMask(radius=1, percent=50, threshold=3))
+        sharpened = with_text.filter(_UNSHARP_3X3)
 
         # Save
         output_path = output_dir / f"post-{target_width}x{target_height}.png"
-        sharpened.save(output_path, 'PNG', optimize=True)
+        _save_png(sharpened, output_path, compress_level=compress_level)
 
         return [output_path]
 
@@ -699,7 +1248,9 @@ class IconProcessor:
         position: str = "top",
         text_color: Tuple[int, int, int] = (0, 0, 0),
         box_color: Optional[Tuple[int, int, int]] = (255, 255, 255),
-        text_style: str = "classic"
+        text_style: str = "classic",
+        compress_level: int = 6,
+        max_workers: Optional[int] = None
     ) -> Dict[str, List[Path]]:
         """
         Process all generated images for Instagram with text overlay.
@@ -713,6 +1264,8 @@ class IconProcessor:
             text_color: Text color
             box_color: Box background color (None for no box)
             text_style: "classic" (serif) or "brutalist" (monospace, bold)
+            compress_level: PNG compression level (0-9)
+            max_workers: Maximum worker threads (defaults to CPU count)
 
         Returns:
             Dictionary mapping variant names to lists of generated paths
@@ -721,27 +1274,35 @@ class IconProcessor:
         instagram_dir.mkdir(parents=True, exist_ok=True)
 
         results = {}
-        original_images = sorted(originals_dir.glob("variant-*.png"))
-
-        for idx, original_path in enumerate(original_images, 1):
-            variant_name = original_path.stem
-            print(f"\n📸 Processing {variant_name} with text overlay...")
-
-            variant_dir = instagram_dir / variant_name
-            variant_dir.mkdir(exist_ok=True)
-
-            paths = IconProcessor.generate_instagram_with_text(
-                input_path=original_path,
-                output_dir=variant_dir,
-                text=text,
-                aspect_ratio=aspect_ratio,
-                position=position,
-                text_color=text_color,
-                box_color=box_color,
-                text_style=text_style
-            )
-
-            results[variant_name] = paths
-            print(f"✅ Processed Instagram image with text for {variant_name}")
-
-        return results
+        original_images = _variant_paths(originals_dir)
+
+        with ThreadPoolExecutor(_pool_size(len(original_images), max_workers)) as executor:
+            futures = {}
+            for original_path in original_images:
+                variant_name = original_path.stem
+                print(f"\n📸 Processing {variant_name} with text overlay...")
+
+                variant_dir = instagram_dir / variant_name
+                variant_dir.mkdir(exist_ok=True)
+
+                future = executor.submit(
+                    IconProcessor.generate_instagram_with_text,
+                    input_path=original_path,
+                    output_dir=variant_dir,
+                    text=text,
+                    aspect_ratio=aspect_ratio,
+                    position=position,
+                    text_color=text_color,
+                    box_color=box_color,
+                    text_style=text_style,
+                    compress_level=compress_level
+                )
+                futures[future] = variant_name
+
+            for future in as_completed(futures):
+                variant_name = futures[future]
+                results[variant_name] = future.result()
+                print(f"✅ Processed Instagram image with text for {variant_name}")
+
+        # Keep variant order stable regardless of completion order
+        return {path.stem: results[path.stem] for path in original_images}
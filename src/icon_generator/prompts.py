@@ -1,22 +1,74 @@
 """Prompt templates and management for different icon styles."""
 
-from typing import Dict, Optional
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Subjects starting with any of these already read naturally in a prompt
+_PREFIXES = ("icon of", "a ", "an ", "the ")
+
+# First letters that take "an" rather than "a"
+_VOWELS = frozenset("aeiou")
+
+# Stand-in subject for batch builds; split out and replaced per subject
+_SUBJECT_SLOT = "\0"
+
+# A parsed template: (literal text, following field name or None) pairs
+_Segments = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _parse_template(template: str) -> _Segments:
+    """Split a template into literal/field segments (bare {name} fields only)."""
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(
+                f"Field '{field}' in template has a format spec or "
+                "conversion; only bare {name} fields are supported"
+            )
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+@lru_cache(maxsize=1024)
+def _format_cached(
+    segments: _Segments,
+    subject: str,
+    frozen_kwargs: Tuple[Tuple[str, str], ...]
+) -> str:
+    """Fill a parsed template once per distinct set of arguments."""
+    values = dict(frozen_kwargs, subject=subject)
+    return "".join(
+        literal if field is None else literal + str(values[field])
+        for literal, field in segments
+    )
+
 
 class PromptTemplate:
     """Base class for prompt templates."""
 
+    __slots__ = ("positive_template", "negative_prompt", "_segments")
+
     def __init__(self, positive_template: str, negative_prompt: str = ""):
         self.positive_template = positive_template
         self.negative_prompt = negative_prompt
+        # Parsed once so formatting never re-enters the format-string parser
+        self._segments = _parse_template(self.positive_template)
 
     def format(self, subject: str, **kwargs) -> Dict[str, str]:
         """Format the template with the given subject and parameters."""
-        positive = self.positive_template.format(subject=subject, **kwargs)
+        positive, _ = self.format_tuple(subject, **kwargs)
         return {
             "prompt": positive,
             "negative_prompt": self.negative_prompt
         }
 
+    def format_tuple(self, subject: str, **kwargs) -> Tuple[str, str]:
+        """Format the template as an immutable (prompt, negative_prompt) pair."""
+        positive = _format_cached(self._segments, subject, tuple(sorted(kwargs.items())))
+        return positive, self.negative_prompt
+
 
 class IconPrompts:
     """Collection of prompt templates for different icon styles."""
@@ -92,15 +144,19 @@ class IconPrompts:
         "instagram": INSTAGRAM_TEMPLATE,
     }
 
+    # Listed in the unknown-style error message
+    _AVAILABLE_STYLES_STR = ", ".join(STYLE_MAP)
+
     @classmethod
     def get_template(cls, style: str) -> PromptTemplate:
         """Get a prompt template by style name."""
-        if style not in cls.STYLE_MAP:
+        template = cls.STYLE_MAP.get(style)
+        if template is None:
             raise ValueError(
                 f"Unknown style '{style}'. "
-                f"Available styles: {', '.join(cls.STYLE_MAP.keys())}"
+                f"Available styles: {cls._AVAILABLE_STYLES_STR}"
             )
-        return cls.STYLE_MAP[style]
+        return template
 
     @classmethod
     def build_prompt(
@@ -122,6 +178,66 @@ class IconPrompts:
             custom_style: Full custom prompt for style="custom"
             format: Output format ("ios" for app icons, "instagram" for social media)
         """
+        # The custom template is just "{custom_style}", in every format
+        if style == "custom" and custom_style:
+            return {
+                "prompt": custom_style,
+                "negative_prompt": cls.CUSTOM_TEMPLATE.negative_prompt
+            }
+
+        # Cached as an immutable tuple; each caller gets its own dict
+        positive, negative = cls._build_prompt_cached(
+            subject, style, color, extra_style, custom_style, format
+        )
+        return {
+            "prompt": positive,
+            "negative_prompt": negative
+        }
+
+    @classmethod
+    def build_prompts_batch(
+        cls,
+        subjects: Iterable[str],
+        style: str = "ios",
+        color: Optional[str] = None,
+        extra_style: str = "modern, colorful",
+        custom_style: Optional[str] = None,
+        format: str = "ios"
+    ) -> List[Dict[str, str]]:
+        """Build prompts for many subjects that share the same style parameters.
+
+        The template is resolved and filled once; each subject is then
+        spliced into the pre-built prompt.
+
+        Args:
+            subjects: The subjects to generate
+            style: Icon/post style (ios, flat, vector, custom, instagram)
+            color: Background color (for flat style)
+            extra_style: Additional style descriptors
+            custom_style: Full custom prompt for style="custom"
+            format: Output format ("ios" for app icons, "instagram" for social media)
+        """
+        positive, negative = cls._build_prompt_cached(
+            _SUBJECT_SLOT, style, color, extra_style, custom_style, format
+        )
+        parts = positive.split(_SUBJECT_SLOT)
+        return [
+            {"prompt": subject.join(parts), "negative_prompt": negative}
+            for subject in subjects
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _build_prompt_cached(
+        cls,
+        subject: str,
+        style: str,
+        color: Optional[str],
+        extra_style: str,
+        custom_style: Optional[str],
+        format: str
+    ) -> Tuple[str, str]:
+        """Resolve and format the template for one set of prompt parameters."""
         # For Instagram format, use Instagram template unless custom style specified
         if format == "instagram" and style != "custom":
             template = cls.INSTAGRAM_TEMPLATE
@@ -137,17 +253,19 @@ class IconPrompts:
         if style == "custom" and custom_style:
             kwargs["custom_style"] = custom_style
 
-        return template.format(subject, **kwargs)
+        return template.format_tuple(subject, **kwargs)
 
-    @classmethod
-    def enhance_subject(cls, subject: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def enhance_subject(subject: str) -> str:
         """Enhance the subject description for better results."""
         # Basic enhancement - can be expanded
         subject = subject.strip()
 
         # Add "icon of" prefix if not present
-        if not any(subject.lower().startswith(prefix) for prefix in ["icon of", "a ", "an ", "the "]):
-            if subject[0].lower() in 'aeiou':
+        lowered = subject.lower()
+        if not lowered.startswith(_PREFIXES):
+            if lowered[:1] in _VOWELS:
                 subject = f"an {subject}"
             else:
                 subject = f"a {subject}"